@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 noclear = (
     ('C', True),
@@ -27,26 +30,26 @@ noclear = (
     )
 
 
+# one figure, cleared and re-used for each diagram
 fig = plt.figure(figsize=(8,2))
-ax = plt.axes([0,0,1,1])
+ax = fig.add_axes([0,0,1,1])
 
 nt = 1
 nd = 1
+ticks = []
 for n, (letter, flag) in enumerate(noclear):
     x = n
-    if flag:
-        plt.text(x,0,letter,color='g',ha='center',va='center',size=18)
-    else:
-        plt.text(x,0,letter,color='r',ha='center',va='center', size=18)
+    plt.text(x,0,letter,color='g' if flag else 'r',
+             ha='center',va='center',size=18)
 
     if letter == 'E':
         x -= 0.4
-        plt.plot([x,x],[-0.08,-0.3],'k')
+        ticks.append([(x,-0.08),(x,-0.3)])
         plt.text(x,-0.4,'TS{:d}'.format(nt),ha='center',va='center')
         nt += 1
     elif letter == 'R':
         x += 0.4
-        plt.plot([x,x],[0.11,0.3],'k')
+        ticks.append([(x,0.11),(x,0.3)])
         if nd % 3 == 0:
             plt.text(x,+0.4,'F{:d}'.format(nd),color='b',
                      ha='center',va='center')
@@ -55,6 +58,9 @@ for n, (letter, flag) in enumerate(noclear):
                      ha='center',va='center')
         nd += 1
 
+# all the tick marks in one go
+ax.add_collection(LineCollection(ticks,colors='k'))
+
 plt.plot([8.5,16.5,16.5,8.5,8.5],
          [-0.06,-0.06,0.08,0.08,-0.06],'--b')
 
@@ -100,26 +106,25 @@ clear = (
     ('F', False),
     )
 
-fig = plt.figure(figsize=(8,2))
-ax = plt.axes([0,0,1,1])
+fig.clf()
+ax = fig.add_axes([0,0,1,1])
 
 nt = 1
 nd = 1
+ticks = []
 for n, (letter, flag) in enumerate(clear):
     x = n
-    if flag:
-        plt.text(x,0,letter,color='g',ha='center',va='center',size=18)
-    else:
-        plt.text(x,0,letter,color='r',ha='center',va='center', size=18)
+    plt.text(x,0,letter,color='g' if flag else 'r',
+             ha='center',va='center',size=18)
 
     if letter == 'E':
         x -= 0.5
-        plt.plot([x,x],[-0.08,-0.3],'k')
+        ticks.append([(x,-0.08),(x,-0.3)])
         plt.text(x,-0.4,'TS{:d}'.format(nt),ha='center',va='center')
         nt += 1
     elif letter == 'R':
         x += 0.5
-        plt.plot([x,x],[0.11,0.3],'k')
+        ticks.append([(x,0.11),(x,0.3)])
         if nd % 3 == 0:
             plt.text(x,+0.4,'F{:d}'.format(nd),color='b',
                      ha='center',va='center')
@@ -128,6 +133,9 @@ for n, (letter, flag) in enumerate(clear):
                      ha='center',va='center')
         nd += 1
 
+# all the tick marks in one go
+ax.add_collection(LineCollection(ticks,colors='k'))
+
 plt.plot([12.5,21.5,21.5,12.5,12.5],
          [-0.06,-0.06,0.08,0.08,-0.06],'--b')
 
@@ -164,30 +172,32 @@ drift = (
     ('LS', True),
     )
 
-fig = plt.figure(figsize=(8,2))
-ax = plt.axes([0,0,1,1])
+fig.clf()
+ax = fig.add_axes([0,0,1,1])
 
 nt = 1
 nd = -2 # DRIFT NWINS = 3
+ticks = []
 for n, (letter, flag) in enumerate(drift):
     x = 1.5*n
-    if flag:
-        plt.text(x,0,letter,color='g',ha='center',va='center',size=18)
-    else:
-        plt.text(x,0,letter,color='r',ha='center',va='center', size=18)
+    plt.text(x,0,letter,color='g' if flag else 'r',
+             ha='center',va='center',size=18)
 
     if letter == 'E':
         x -= 0.5
-        plt.plot([x,x],[-0.08,-0.3],'k')
+        ticks.append([(x,-0.08),(x,-0.3)])
         plt.text(x,-0.4,'TS{:d}'.format(nt),ha='center',va='center')
         nt += 1
     elif letter == 'R':
         x += 0.5
-        plt.plot([x,x],[0.11,0.3],'k')
+        ticks.append([(x,0.11),(x,0.3)])
         plt.text(x,+0.4,'F{:d}'.format(nd),color='b',
                  ha='center',va='center')
         nd += 1
 
+# all the tick marks in one go
+ax.add_collection(LineCollection(ticks,colors='k'))
+
 plt.plot([0.8,2.,2.,0.8,0.8],
          [-0.06,-0.06,0.08,0.08,-0.06],'--r')
 
@@ -48,10 +48,10 @@ container class :class:`Group`). It then sets this pixel to zero and writes
 out the result to a new file.
 """
 
-from pkg_resources import get_distribution, DistributionNotFound
+from importlib.metadata import version as _version, PackageNotFoundError
 try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
+    __version__ = _version(__name__)
+except PackageNotFoundError:
     # package is not installed
     pass
 
@@ -7,7 +7,6 @@ a fairly easily read and editable format.
 
 import numpy as np
 import json
-from collections import OrderedDict
 from .core import *
 from .group import *
 
@@ -41,6 +40,12 @@ class Aperture:
 
     """
 
+    # fixed set of attributes: saves the per-instance dictionary since
+    # there can be many apertures
+    __slots__ = (
+        'x', 'y', 'rtarg', 'rsky1', 'rsky2', 'ref', 'mask', 'extra', 'link'
+    )
+
     def __init__(self, x, y, rtarg, rsky1, rsky2, ref, mask=[], extra=[],
                  link=''):
         """Constructor. Arguments::
@@ -165,11 +170,11 @@ class Aperture:
     def write(self, fname):
         """Dumps Aperture in JSON format to a file called fname"""
         with open(fname,'w') as fp:
-            json.dump(self, cls=_Encoder, indent=2)
+            json.dump(self, fp, cls=_Encoder, indent=2)
 
     def toString(self):
         """Returns Aperture as a JSON-type string"""
-        return json.dumps(self, fp, cls=_Encoder, indent=2)
+        return json.dumps(self, cls=_Encoder, indent=2)
 
     @classmethod
     def read(cls, fname):
@@ -301,20 +306,20 @@ class _Encoder(json.JSONEncoder):
     def default(self, obj):
 
         if isinstance(obj, Aperture):
-            return OrderedDict(
-                (
-                    ('Comment', 'hipercam.Aperture'),
-                    ('x', obj.x),
-                    ('y', obj.y),
-                    ('rtarg', obj.rtarg),
-                    ('rsky1', obj.rsky1),
-                    ('rsky2', obj.rsky2),
-                    ('ref', obj.ref),
-                    ('mask', obj.mask),
-                    ('extra', obj.extra),
-                    ('link', obj.link),
-                    )
-                )
+            # dicts retain insertion order, which fixes the order of
+            # the entries in the file
+            return {
+                'Comment': 'hipercam.Aperture',
+                'x': obj.x,
+                'y': obj.y,
+                'rtarg': obj.rtarg,
+                'rsky1': obj.rsky1,
+                'rsky2': obj.rsky2,
+                'ref': obj.ref,
+                'mask': obj.mask,
+                'extra': obj.extra,
+                'link': obj.link,
+            }
 
         return super().default(obj)
 
@@ -325,11 +330,11 @@ class _Decoder(json.JSONDecoder):
 
     def object_hook(self, obj):
         # looks out for Aperture objects. Everything else done by default
-        if 'rtarg' in obj and 'rsky1' in obj and 'rsky2' in obj and 'link' in obj:
+        try:
             return Aperture(
                 obj['x'], obj['y'], obj['rtarg'], obj['rsky1'], obj['rsky2'],
                 obj['ref'], obj['mask'], obj['extra'], obj['link']
             )
-
-        return obj
+        except KeyError:
+            return obj
 
@@ -605,7 +605,8 @@ class MCCD(Agroup):
         """
         return (self.__class__, (list(self.items()), self.head))
 
-    def write(self, fname, overwrite=False, xgap=200, ygap=200):
+    def write(self, fname, overwrite=False, xgap=200, ygap=200,
+              output_verify='exception'):
         """Writes out the MCCD to a FITS file.
 
         Arguments::
@@ -623,6 +624,11 @@ class MCCD(Agroup):
             ygap  : int
                Y-gap used to space CCDs for ds9 mosaicing (unbinned pixels)
 
+            output_verify : string
+               FITS verification option passed to astropy's writeto.
+               'ignore' skips the header checks, which can take a good
+               fraction of the write time for small frames.
+
         """
 
         phead = self.head.copy()
@@ -658,7 +664,7 @@ class MCCD(Agroup):
                 yoff -= (ccd.nytot+2*ccd.nypad) + ygap
             else:
                 xoff += (ccd.nxtot+2*ccd.nxpad) + xgap
-        hdul.writeto(fname, overwrite=overwrite)
+        hdul.writeto(fname, overwrite=overwrite, output_verify=output_verify)
 
     @classmethod
     def read(cls, fname):
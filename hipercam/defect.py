@@ -8,7 +8,6 @@ defects.
 
 import numpy as np
 import json
-from collections import OrderedDict
 from abc import ABC, abstractmethod
 from enum import Enum
 from .core import *
@@ -330,36 +329,30 @@ class _Encoder(json.JSONEncoder):
     def default(self, obj):
 
         if isinstance(obj, Point):
-            return OrderedDict(
-                (
-                    ('Comment', 'hipercam.defect.Point'),
-                    ('severity', obj.severity.name),
-                    ('x', obj.x),
-                    ('y', obj.y),
-                    )
-                )
+            return {
+                'Comment': 'hipercam.defect.Point',
+                'severity': obj.severity.name,
+                'x': obj.x,
+                'y': obj.y,
+            }
 
         elif isinstance(obj, Line):
-            return OrderedDict(
-                (
-                    ('Comment', 'hipercam.defect.Line'),
-                    ('severity', obj.severity.name),
-                    ('x1', obj.x1),
-                    ('y1', obj.y1),
-                    ('x2', obj.x2),
-                    ('y2', obj.y2),
-                    )
-                )
+            return {
+                'Comment': 'hipercam.defect.Line',
+                'severity': obj.severity.name,
+                'x1': obj.x1,
+                'y1': obj.y1,
+                'x2': obj.x2,
+                'y2': obj.y2,
+            }
 
         elif isinstance(obj, Hot):
-            return OrderedDict(
-                (
-                    ('Comment', 'hipercam.defect.Hot'),
-                    ('severity', obj.severity.name),
-                    ('x', obj.x),
-                    ('y', obj.y),
-                    )
-                )
+            return {
+                'Comment': 'hipercam.defect.Hot',
+                'severity': obj.severity.name,
+                'x': obj.x,
+                'y': obj.y,
+            }
 
         return super().default(obj)
 
@@ -650,6 +650,39 @@ def dmoffat(x, y, sky, height, xcen, ycen, fwhm, beta, xbin, ybin, ndiv,
         else:
             return (dsky, dheight, dxcen, dycen, dycen, dycen)
 
+@jit(nopython=True,cache=True)
+def _residuals(data, model, sigma):
+    """Returns the normalised residuals (data-model)/sigma as a 1D array,
+    skipping any pixels with sigma <= 0 which flag rejected pixels. This is
+    the same as ((data-model)/sigma)[sigma > 0] but avoids the temporary
+    arrays since it is called on every iteration of the fits.
+    """
+    ny, nx = data.shape
+    resid = np.empty(ny*nx)
+    n = 0
+    for iy in range(ny):
+        for ix in range(nx):
+            if sigma[iy,ix] > 0:
+                resid[n] = (data[iy,ix]-model[iy,ix])/sigma[iy,ix]
+                n += 1
+    return resid[:n]
+
+@jit(nopython=True,cache=True)
+def _dresiduals(deriv, sigma):
+    """Returns the partial derivative of the normalised residuals given the
+    partial derivative `deriv` of the model, i.e. -deriv/sigma, as a 1D array
+    skipping any pixels with sigma <= 0. Matches :func:`_residuals`.
+    """
+    ny, nx = deriv.shape
+    dresid = np.empty(ny*nx)
+    n = 0
+    for iy in range(ny):
+        for ix in range(nx):
+            if sigma[iy,ix] > 0:
+                dresid[n] = -deriv[iy,ix]/sigma[iy,ix]
+                n += 1
+    return dresid[:n]
+
 class Mfit1:
     """
     Function object to pass to leastsq for Moffat + constant
@@ -689,9 +722,7 @@ class Mfit1:
         method for a description of the argument 'param'
         """
         mod = self.model(param)
-        diff = (self.data-mod)/self.sigma
-        ok = self.sigma > 0
-        return diff[ok].ravel()
+        return _residuals(self.data, mod, self.sigma)
 
     def model(self, param):
         """
@@ -743,8 +774,7 @@ class Dmfit1:
             self.x, self.y, sky, height, xcen, ycen, fwhm, beta,
             self.xbin, self.ybin, self.ndiv, True, True
         )
-        ok = self.sigma > 0
-        return [(-deriv[ok]/self.sigma[ok]).ravel() for deriv in derivs]
+        return [_dresiduals(deriv, self.sigma) for deriv in derivs]
 
 class Mfit2:
     """
@@ -788,9 +818,7 @@ class Mfit2:
         Returns 1D array of normalised residuals
         """
         mod = self.model(param)
-        diff = (self.data-mod)/self.sigma
-        ok = self.sigma > 0
-        return diff[ok].ravel()
+        return _residuals(self.data, mod, self.sigma)
 
     def model(self, param):
         """
@@ -842,8 +870,7 @@ class Dmfit2:
             self.x, self.y, sky, height, xcen, ycen, self.fwhm, beta,
             self.xbin, self.ybin, self.ndiv, False, True
         )
-        ok = self.sigma > 0
-        return [(-deriv[ok]/self.sigma[ok]).ravel() for deriv in derivs[:-1]]
+        return [_dresiduals(deriv, self.sigma) for deriv in derivs[:-1]]
 
 class Mfit3:
     """
@@ -891,9 +918,7 @@ class Mfit3:
         Returns 1D array of normalised residuals
         """
         mod = self.model(param)
-        diff = (self.data-mod)/self.sigma
-        ok = self.sigma > 0
-        return diff[ok].ravel()
+        return _residuals(self.data, mod, self.sigma)
 
     def model(self, param):
         """
@@ -946,8 +971,7 @@ class Dmfit3:
             self.x, self.y, sky, height, xcen, ycen, self.fwhm, self.beta,
             self.xbin, self.ybin, self.ndiv, False, False
         )
-        ok = self.sigma > 0
-        return [(-deriv[ok]/self.sigma[ok]).ravel() for deriv in derivs[:-2]]
+        return [_dresiduals(deriv, self.sigma) for deriv in derivs[:-2]]
 
 ##########################################
 #
@@ -1423,9 +1447,7 @@ class Gfit1:
         method for a description of the argument 'param'
         """
         mod = self.model(param)
-        diff = (self.data-mod)/self.sigma
-        ok = self.sigma > 0
-        return diff[ok].ravel()
+        return _residuals(self.data, mod, self.sigma)
 
     def model(self, param):
         """Returns 2D array with model given a parameter vector.
@@ -1475,8 +1497,7 @@ class Dgfit1:
             self.x, self.y, sky, height, xcen, ycen, fwhm,
             self.xbin, self.ybin, self.ndiv
         )
-        ok = self.sigma > 0
-        return [(-deriv[ok]/self.sigma[ok]).ravel() for deriv in derivs]
+        return [_dresiduals(deriv, self.sigma) for deriv in derivs]
 
 class Gfit2:
     """
@@ -1522,8 +1543,7 @@ class Gfit2:
         """
 
         mod = self.model(param)
-        diff = (self.data-mod)/self.sigma
-        return diff[self.sigma > 0].ravel()
+        return _residuals(self.data, mod, self.sigma)
 
     def model(self, param):
         """Returns 2D array with model given a parameter vector.
@@ -1578,6 +1598,4 @@ class Dgfit2:
 
         # note one more derivative is resturned than we need, so
         # we cut it out (the last one)
-        ok = self.sigma > 0
-        sigs = self.sigma[ok]
-        return [(-deriv[ok]/sigs).ravel() for deriv in derivs[:-1]]
+        return [_dresiduals(deriv, self.sigma) for deriv in derivs[:-1]]
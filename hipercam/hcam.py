@@ -14,10 +14,11 @@ import sys
 import struct
 import warnings
 import json
+import weakref
 import websocket
 
 import numpy as np
-from numpy.lib.stride_tricks import as_strided
+from numba import jit
 from astropy.io import fits
 from astropy.time import Time, TimeDelta
 
@@ -77,6 +78,7 @@ FLIP_AXES = {'E': (), 'F': (1,), 'G': (1, 0), 'H': (0,)}
 # CCD was 180 degrees rotated cf intended).
 REFLECTED = (1, 4)
 QNAMS = ('E', 'F', 'G', 'H')
+CNAMS = ('1', '2', '3', '4', '5')
 QNAMS_REFLECT = {'E': 'F', 'F': 'E', 'G': 'H', 'H': 'G'}
 QNAMS_ROTATED = {'E': 'G', 'F': 'H', 'G': 'E', 'H': 'F'}
 
@@ -194,6 +196,7 @@ class Rhead:
         if server:
             # open socket connection to server
             self._ws = websocket.create_connection(URL + fname)
+            self._finalizer = weakref.finalize(self, self._ws.close)
             status = json.loads(self._ws.recv())['status']
             if status == 'no such run':
                 raise HipercamError('Run not found: {}'.format(fname))
@@ -212,6 +215,7 @@ class Rhead:
         else:
             # open the file
             self._ffile = open(add_extension(fname, HRAW),'rb')
+            self._finalizer = weakref.finalize(self, self._ffile.close)
 
             # read the header
             hd = self.header = Header(
@@ -408,18 +412,7 @@ class Rhead:
                             # present
                             ny += self.noscan
 
-                        win_xs = hd[winID + 'XS{}'.format(qnam)]
-                        win_nx = hd[winID + 'NX']
-                        win_ys = hd[winID + 'YS']
-                        win_ny = hd[winID + 'NY']
-                        llx = (
-                            LLX[qnam] + X_DIRN[qnam] * win_xs +
-                            ADD_XSIZES[qnam] * (HCM_NXTOT//2 - win_nx)
-                        )
-                        lly = (
-                            LLY[qnam] + Y_DIRN[qnam] * win_ys +
-                            ADD_YSIZES[qnam] * (HCM_NYTOT//2 - win_ny)
-                        )
+                        llx, lly = _window_ll(hd, winID, qnam)
 
                     elif self.mode.startswith('Drift'):
                         nx = hd['ESO DET DRWIN NX'] // self.xbin
@@ -430,18 +423,7 @@ class Rhead:
                                 'prescans with drift mode undefined'
                             )
 
-                        win_xs = hd['ESO DET DRWIN XS{}'.format(qnam)]
-                        win_nx = hd['ESO DET DRWIN NX']
-                        win_ys = hd['ESO DET DRWIN YS']
-                        win_ny = hd['ESO DET DRWIN NY']
-                        llx = (
-                            LLX[qnam] + X_DIRN[qnam] * win_xs +
-                            ADD_XSIZES[qnam] * (HCM_NXTOT//2 - win_nx)
-                        )
-                        lly = (
-                            LLY[qnam] + Y_DIRN[qnam] * win_ys +
-                            ADD_YSIZES[qnam] * (HCM_NYTOT//2 - win_ny)
-                        )
+                        llx, lly = _window_ll(hd, 'ESO DET DRWIN ', qnam)
 
                     else:
                         msg = 'mode {} not currently supported'.format(mode)
@@ -692,19 +674,18 @@ class Rhead:
 
         return (tmid, texp, flag)
 
-    def __del__(self):
-        """Destructor closes the file or web socket"""
-        if self.server:
-            if hasattr(self, '_ws'): self._ws.close()
-        else:
-            if hasattr(self, '_ffile'): self._ffile.close()
+    def close(self):
+        """Closes the file or web socket. This happens automatically when the
+        object is garbage collected, but it is better done explicitly, e.g. by
+        using the object as a context manager."""
+        self._finalizer()
 
     # Want to run this as a context manager
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
-        self.__del__()
+        self.close()
 
 class Rdata (Rhead):
     """Callable, iterable object to represent HiPERCAM raw data files.
@@ -766,6 +747,21 @@ class Rdata (Rhead):
         # read the header
         Rhead.__init__(self, fname, server, full)
 
+        # Get number of samples per pixel, with a default of 4.  Pixel data
+        # order depends on the number of samples, and the data prior to
+        # implementing sampling (i.e. October 2017 WHT run) is the same as
+        # nsamps = 4.
+        self._nsamps = self.header.get('ESO DET NSAMP', 4)
+
+        # flags for the axes to flip for each window of each quadrant of each
+        # CCD, in the form needed by _demultiplex
+        self._flips = np.zeros((len(self.nwins), 5, 4, 2), dtype=np.bool_)
+        for nwin in self.nwins:
+            for nccd in range(5):
+                for nquad in range(4):
+                    for ax in self.windows[nwin][nccd][nquad][1]:
+                        self._flips[nwin, nccd, nquad, ax] = True
+
         # flag to indicate should always try to get the last frame
         self.last = (nframe == 0)
 
@@ -778,6 +774,11 @@ class Rdata (Rhead):
         if server:
             self.nframe = nframe
         else:
+            # buffer re-used for every frame read from the local file. The
+            # Windows of the MCCDs returned are filled by _demultiplex so
+            # nothing is left pointing at it.
+            self._fbuffer = bytearray(self._framesize)
+
             # local file: go to correct location
             if self.last:
                 self.seek_last()
@@ -884,10 +885,8 @@ class Rdata (Rhead):
                 # with None. NB we do not update self.nframe in this case.
                 return None
 
-            # separate into the frame and timing data, correcting the frame
-            # bytes for the FITS BZERO offset
-            frame  = np.fromstring(raw_bytes[:-self.ntbytes], '>u2')
-            frame += BZERO
+            # separate into the frame and timing data
+            frame  = np.frombuffer(raw_bytes[:-self.ntbytes], '>u2')
             tbytes = raw_bytes[-self.ntbytes:]
 
         else:
@@ -921,22 +920,22 @@ class Rdata (Rhead):
                 # move to correct place
                 self.seek_frame(nframe)
 
-            # read in frame and then the timing data, correcting the frame for
-            # the standard FITS BZERO offset. At this stage we have the data
-            # as unsigned 2-byte ints
-            frame = np.fromfile(
-                self._ffile, '>u2', (self._framesize - self.ntbytes) // 2
-                )
-            frame += BZERO
-            tbytes = self._ffile.read(self.ntbytes)
-            if len(tbytes) != self.ntbytes:
+            # read in the frame and timing data in one go straight into the
+            # buffer, then view the pixels as big-endian 2-byte ints without
+            # a copy.
+            if self._ffile.readinto(self._fbuffer) != self._framesize:
                 raise HendError('failed to read frame from disk file')
+            frame = np.frombuffer(
+                self._fbuffer, '>u2', (self._framesize - self.ntbytes) // 2
+            )
+            tbytes = bytes(self._fbuffer[-self.ntbytes:])
 
         ##############################################################
         #
         # We now have all the pixels (in 'frame') and timing bytes (in
         # 'tbytes') of the frame of interest read into a 1D ndarray of
-        # unsigned, 2-byte integers. Now interpret them.
+        # big-endian 2-byte integers, still to be corrected for the
+        # standard FITS BZERO offset. Now interpret them.
         #
         ##############################################################
 
@@ -1003,7 +1002,6 @@ class Rdata (Rhead):
         # second, the data bytes
 
         # build Windows-->CCDs-->MCCD
-        CNAMS = ('1', '2', '3', '4', '5')
 
         # update the headers, initialise the CCDs
         cheads = {}
@@ -1061,25 +1059,12 @@ class Rdata (Rhead):
             # allwins contains data of all windows 1 or 2
             allwins = frame[npixel:npixel+nchunk]
 
-            # re-format the data as a 4D array indexed by (ccd,window,y,x)
-
-            # Get number of samples per pixel, with a default of 4.  Pixel
-            # data order depends on the number of samples, and the data prior
-            # to implementing sampling (i.e. October 2017 WHT run) is the same
-            # as nsamps = 4. Use 'as_strided' to perform the de-multiplexing.
-            nsamps = self.header.get('ESO DET NSAMP', 4)
-            if nsamps == 4:
-                data = as_strided(
-                    allwins, strides=(8, 2, 40*win.nx, 40),
-                    shape=(5, 4, win.ny, win.nx)
-                )
-            else:
-                # with 1 sample per pixel the data cannot be simply
-                # re-viewed but a copy must be made.
-                data = as_strided(
-                    allwins, strides=(32, 2, 160, 8),
-                    shape=(5, 4, len(frame)//80, 4)
-                ).reshape(5, 4, win.ny, win.nx)
+            # re-format the data as a 4D array of 32-bit floats indexed by
+            # (ccd,quad,y,x), already flipped into the correct orientation
+            data = np.empty((5, 4, win.ny, win.nx), dtype=np.float32)
+            _demultiplex(
+                allwins.view(np.uint8), self._nsamps, self._flips[nwin], data
+            )
 
             # now build the Windows. This is where we chop off any pre- and
             # over-scan
@@ -1091,19 +1076,16 @@ class Rdata (Rhead):
                         # reflections for g (1) and z (4)
                         qnam = QNAMS_REFLECT[qnam]
 
-                    # recover the window and flip parameters
-                    win, flip_axes = self.windows[nwin][nccd][nquad]
+                    # recover the window
+                    win = self.windows[nwin][nccd][nquad][0]
 
-                    # get the window data and apply flips.
+                    # get the window data, which already has the
+                    # appropriate orientation. Now finally store in a
+                    # Window or two Windows, splitting off the pre-scan
+                    # section in the latter case. The split parts are
+                    # copied so that each Window has its own contiguous
+                    # array, as it would without a pre-scan.
                     windata = data[nccd, nquad]
-                    for ax in flip_axes:
-                        windata = np.flip(windata, ax)
-
-                    # at this point the data array has the appropriate
-                    # orientation. Now finally store in a Window or
-                    # two Windows, splitting off the pre-scan section
-                    # in the latter case. We also convert to 32-bit
-                    # floats to avoid problems down the line.
 
                     if self.pscan:
                         # pre-scan present. Reduce the size of the data window
@@ -1132,8 +1114,7 @@ class Rdata (Rhead):
                             # (outputs are on the left). Create the Window
                             # with the image data, stripping off the prescan
                             ccds[cnam][wnam] = Window(
-                                winh, windata[:,self.npscan:].astype(
-                                    np.float32), True
+                                winh, np.ascontiguousarray(windata[:,self.npscan:]), True
                             )
 
                             # Store the prescan itself
@@ -1144,16 +1125,14 @@ class Rdata (Rhead):
 
                             # Create the Window with the pre-scan
                             ccds[cnam][wpnam] = Window(
-                                winp, windata[:,:self.npscan].astype(
-                                    np.float32), True
+                                winp, np.ascontiguousarray(windata[:,:self.npscan]), True
                             )
 
                         else:
                             # Prescan on the right. Create the Window with the
                             # image data, stripping off the prescan
                             ccds[cnam][wnam] = Window(
-                                winh, windata[:,:-self.npscan].astype(
-                                    np.float32), True
+                                winh, np.ascontiguousarray(windata[:,:-self.npscan]), True
                             )
 
                             # Now save the prescan itself
@@ -1164,8 +1143,7 @@ class Rdata (Rhead):
 
                             # Create the Window with the pre-scan
                             ccds[cnam][wpnam] = Window(
-                                winp, windata[:,-self.npscan:].astype(
-                                    np.float32), True
+                                winp, np.ascontiguousarray(windata[:,-self.npscan:]), True
                             )
 
                     else:
@@ -1176,7 +1154,7 @@ class Rdata (Rhead):
                             win.update(cheads[cnam])
 
                         ccds[cnam][wnam] = Window(
-                            win, windata.astype(np.float32), True
+                            win, windata, True
                         )
 
                     if self.oscan:
@@ -1301,8 +1279,9 @@ class Rtime (Rhead):
               Python-based server that defaults to port 8007.
         """
 
-        # read the header
-        Rhead.__init__(self, fname, server)
+        # read the header. No MCCDs are made, so the extra detail of
+        # the top-level and CCD headers is not needed.
+        Rhead.__init__(self, fname, server, full=False)
 
         # move to the start of the timing bytes
         self.nframe = nframe
@@ -1418,6 +1397,62 @@ class Rtime (Rhead):
         # Return timing data
         return (tstamp, tuple(tinfo), tflag)
 
+def _window_ll(hd, winID, qnam):
+    """Returns the (llx,lly) unbinned coordinates of the lower-left pixel of
+    the window of quadrant qnam whose header items start with winID, e.g.
+    'ESO DET WIN1 ' or 'ESO DET DRWIN '. The header items are unbinned
+    start positions and dimensions measured from the readout corner of the
+    quadrant.
+    """
+    llx = (
+        LLX[qnam] + X_DIRN[qnam] * hd[winID + 'XS{}'.format(qnam)] +
+        ADD_XSIZES[qnam] * (HCM_NXTOT//2 - hd[winID + 'NX'])
+    )
+    lly = (
+        LLY[qnam] + Y_DIRN[qnam] * hd[winID + 'YS'] +
+        ADD_YSIZES[qnam] * (HCM_NYTOT//2 - hd[winID + 'NY'])
+    )
+    return (llx, lly)
+
+@jit(nopython=True, cache=True)
+def _demultiplex(raw, nsamps, flips, data):
+    """De-multiplexes the raw bytes of one set of windows of a frame into
+    separate windows for each quadrant of each CCD. This is a single pass which
+    also corrects for the FITS BZERO offset, converts the data to the type of
+    `data` and flips the windows into the correct orientation.
+
+    Arguments::
+
+       raw : 1D ndarray of uint8
+           the bytes of the set of windows, as big-endian 2-byte ints
+
+       nsamps : int
+           number of samples per pixel, which sets the order of the pixels
+
+       flips : 3D ndarray of bool
+           flips[nccd,nquad,ax] is True if axis 'ax' of the window of quadrant
+           nquad of CCD nccd has to be flipped (as in numpy.flip)
+
+       data : 4D ndarray
+           array indexed by (ccd,quad,y,x) into which the windows are written.
+    """
+    ny, nx = data.shape[2], data.shape[3]
+    for nccd in range(5):
+        for nquad in range(4):
+            flipy, flipx = flips[nccd,nquad]
+            for iy in range(ny):
+                row = data[nccd, nquad, ny-1-iy if flipy else iy]
+                for ix in range(nx):
+                    p = nx*iy + ix
+                    if nsamps == 4:
+                        # pixels come in as (y,x,ccd,quad)
+                        n = 2*(20*p + 4*nccd + nquad)
+                    else:
+                        # pixels come in blocks of 4 as (block,ccd,pixel,quad)
+                        n = 2*(80*(p >> 2) + 16*nccd + 4*(p & 3) + nquad)
+                    row[nx-1-ix if flipx else ix] = \
+                        ((raw[n] << 8) | raw[n+1]) ^ BZERO
+
 def decode_timing_bytes(tbytes):
     """Decode the timing bytes tacked onto the end of every HiPERCAM frame in the
     3D FITS file.
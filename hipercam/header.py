@@ -35,6 +35,10 @@ class Header:
 
     SPECIAL_KEYWORDS = ('COMMENT', 'HISTORY', '')
 
+    # fixed set of attributes: saves the per-instance dictionary since every
+    # Window of every frame is a Header
+    __slots__ = ('cards', '_lookup', '_hstart', '_hstop', '_cstart', '_cstop')
+
     def __init__(self, head=None, copy=False):
         """Initialiser. 'head' can be (i) another Header, (ii) an ordered
         dictionary with values set to 2-element tuples containing
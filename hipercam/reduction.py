@@ -2,7 +2,9 @@
 This contains code used in common by the scripts reduce.py and psf_reduce.py
 """
 from collections import OrderedDict
+import copy
 import sys
+import multiprocessing.pool
 import warnings
 import numpy as np
 from astropy.time import Time
@@ -130,6 +132,13 @@ class Rfile(OrderedDict):
         if sect['ngroup'] < 1:
             raise hcam.HipercamError('general.ngroup must be >= 1')
 
+        # optional, for compatibility with files that pre-date it
+        sect['parallel'] = sect.get('parallel', 'processes')
+        if sect['parallel'] not in ('processes', 'threads'):
+            raise hcam.HipercamError(
+                "general.parallel must be 'processes' or 'threads'"
+            )
+
         #
         # apertures section
         #
@@ -1242,6 +1251,20 @@ class ProcessCCDs:
                 )
                 allres.append(res)
 
+            elif isinstance(self.pool, multiprocessing.pool.ThreadPool):
+                # threads share memory, so give each task its own copy of
+                # the parts of rfile and store that moveApers modifies,
+                # as happens implicitly through pickling with processes.
+                # Only the apertures of this CCD are copied in full.
+                rfile = copy.copy(self.rfile)
+                rfile['apertures'] = self.rfile['apertures'].copy()
+                rfile.aper = hcam.MccdAper(self.rfile.aper)
+                rfile.aper[cnam] = self.rfile.aper[cnam].copy()
+                arglist.append(
+                    (cnam, pcds, mcds, nfrs, self.read[cnam], self.gain[cnam],
+                     self.mwins[cnam], rfile, copy.deepcopy(self.store[cnam]))
+                )
+
             else:
                 # store arguments lists for later parallel processing
                 arglist.append(
@@ -1741,6 +1764,14 @@ def moveApers(cnam, ccd, read, gain, ccdwin, rfile, store):
         store['mfwhm'] = fsum / wfsum
         apsec['fit_fwhm'] = store['mfwhm']
         store['nok'] += 1
+
+        if apsec['fit_ndiv'] == 0:
+            wind = next(iter(ccd.values()))
+            if store['mfwhm'] < 2*max(wind.xbin, wind.ybin):
+                warnings.warn(
+                    'measured FWHM < 2 binned pixels; profile fit is'
+                    ' undersampled, consider fit_ndiv = 2 in the reduce file'
+                )
     else:
         store['mfwhm'] = -1
 
@@ -4,39 +4,58 @@ the terminal. They are all implemented as functions for automatic
 inclusion in the documentation and for portability
 """
 
-from .arith import add, div, mul, sub
-from .averun import averun
-from .carith import cadd, cdiv, cmul, csub
-from .combine import combine
-from .flagcloud import flagcloud
-from .grab import grab
-from .genred import genred
-from .hist import hist
-from .hinfo import hinfo
-from .hfilter import hfilter
-from .hlogger import hlogger
-from .hls import hls
-from .hplot import hplot
-from .makebias import makebias
-from .makedark import makedark
-from .makeflat import makeflat
-from .makestuff import makedata, makefield
-from .plog import plog
-from .reduce import reduce
-from .rtplot import rtplot
-from .setaper import setaper
-from .setdefect import setdefect
-from .stats import stats
-from .times import times
-from .mstats import mstats
-from .pfolder import pfolder
-from .uls import uls
-from .fits2hcm import fits2hcm
-from .hlog2fits import hlog2fits
-from .redanal import redanal
-from .splice import splice
+import importlib
 
-__all__ = [ \
+# Maps each command onto the module that defines it. The modules are only
+# imported when the command is first accessed, as many of them pull in
+# heavy dependencies (matplotlib, scipy, etc) which are not needed if only
+# one command is wanted. This is also used to dispatch commands run as
+# 'python -m hipercam.scripts command'.
+COMMANDS = {
+    'add' : 'arith',
+    'aligntool' : 'aligntool',
+    'averun' : 'averun',
+    'cadd' : 'carith',
+    'cdiv' : 'carith',
+    'cmul' : 'carith',
+    'combine' : 'combine',
+    'csub' : 'carith',
+    'digest' : 'digest',
+    'div' : 'arith',
+    'fits2hcm' : 'fits2hcm',
+    'flagcloud' : 'flagcloud',
+    'genred' : 'genred',
+    'grab' : 'grab',
+    'hfilter' : 'hfilter',
+    'hinfo' : 'hinfo',
+    'hist' : 'hist',
+    'hlog2fits' : 'hlog2fits',
+    'hlogger' : 'hlogger',
+    'hls' : 'hls',
+    'hplot' : 'hplot',
+    'makebias' : 'makebias',
+    'makedark' : 'makedark',
+    'makedata' : 'makestuff',
+    'makefield' : 'makestuff',
+    'makeflat' : 'makeflat',
+    'mstats' : 'mstats',
+    'mul' : 'arith',
+    'pfolder' : 'pfolder',
+    'plog' : 'plog',
+    'psf_reduce' : 'psf_reduce',
+    'redanal' : 'redanal',
+    'reduce' : 'reduce',
+    'rtplot' : 'rtplot',
+    'setaper' : 'setaper',
+    'setdefect' : 'setdefect',
+    'splice' : 'splice',
+    'stats' : 'stats',
+    'sub' : 'arith',
+    'times' : 'times',
+    'uls' : 'uls',
+}
+
+_ALL = [ \
             'add', 'averun',
             'cadd', 'cdiv', 'cmul', 'combine', 'csub',
             'div',
@@ -50,17 +69,33 @@ __all__ = [ \
             'uls',
         ]
 
-try:
-    # allow this one to fail
-    from .aligntool import aligntool
-    __all__.append('aligntool')
-except:
-    pass
+# commands with optional dependencies, only listed in __all__ if they can be
+# imported. As this means importing them, the check is put off until
+# __all__ is first needed, e.g. by 'from hipercam.scripts import *'.
+_OPTIONAL = ('aligntool', 'psf_reduce')
+
+def __getattr__(name):
+    """Imports commands on first access"""
+    if name == '__all__':
+        names = list(_ALL)
+        for opt in _OPTIONAL:
+            try:
+                __getattr__(opt)
+                names.append(opt)
+            except Exception:
+                # allow these to fail
+                pass
+        globals()['__all__'] = names
+        return names
+
+    if name in COMMANDS:
+        module = importlib.import_module('.' + COMMANDS[name], __name__)
+        func = globals()[name] = getattr(module, name)
+        return func
 
-try:
-    # optional dependency on photutils, so allow failure
-    from .psf_reduce import psf_reduce
-    __all__.append('psf_reduce')
-except:
-    pass
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
 
+def __dir__():
+    return sorted(set(globals()) | set(COMMANDS))
@@ -0,0 +1,22 @@
+"""
+Runs HiPERCAM commands as 'python -m hipercam.scripts command [args]',
+importing only the module that defines the command.
+"""
+
+import sys
+import importlib
+
+from hipercam.scripts import COMMANDS
+
+if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+    print(
+        'usage: python -m hipercam.scripts command [args]\n\ncommands: ' +
+        ', '.join(sorted(COMMANDS)), file=sys.stderr
+    )
+    sys.exit(1)
+
+command = sys.argv[1]
+module = importlib.import_module('.' + COMMANDS[command], 'hipercam.scripts')
+
+# pass the command name first as if run from the terminal
+getattr(module, command)([command] + sys.argv[2:])
@@ -6,6 +6,7 @@ import numpy as np
 import hipercam as hcam
 from hipercam import cline, utils
 from hipercam.cline import Cline
+from hipercam.scripts import grab, combine
 
 __all__ = ['averun',]
 
@@ -244,7 +245,7 @@ def averun(args=None):
                 str(first),str(last),str(twait),
                 str(tmax),'none','f32'
             ]
-        flist = hcam.scripts.grab(args)
+        flist = grab(args)
 
     try:
         print("\nCalling 'combine' ...")
@@ -268,7 +269,7 @@ def averun(args=None):
                 'usemean=yes', 'plot=no',
                 'yes' if clobber else 'no', output
             ]
-        hcam.scripts.combine(args)
+        combine(args)
 
         # remove temporary files
         with open(flist) as fin:
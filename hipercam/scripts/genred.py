@@ -1,5 +1,6 @@
 import sys
 import os
+from collections import defaultdict
 from time import gmtime, strftime
 
 import hipercam as hcam
@@ -7,14 +8,120 @@ from hipercam import cline, utils
 from hipercam.cline import Cline
 
 # get hipercam version to write into the reduce file
-from pkg_resources import get_distribution, DistributionNotFound
+from importlib.metadata import version, PackageNotFoundError
 try:
-    hipercam_version = get_distribution('hipercam').version
-except DistributionNotFound:
+    hipercam_version = version('hipercam')
+except PackageNotFoundError:
     hipercam_version = 'not found'
 
 __all__ = ['genred',]
 
+# parameters prompted for by default and hidden ones, in the order in
+# which they are registered. 'rfile' is global, all others are local.
+_PROMPTED = ('apfile', 'rfile', 'comment', 'bias', 'flat', 'dark', 'linear')
+
+_HIDDEN = (
+    'inst', 'ncpu', 'ngroup', 'extendx', 'ccd', 'location', 'toffset',
+    'smoothfwhm', 'fft', 'beta', 'betamax', 'fwhm', 'method', 'fwhmmin',
+    'searchwidth', 'fitwidth', 'maxshift', 'thresh', 'hminref', 'hminnrf',
+    'alpha', 'diff', 'rfac', 'rmin', 'rmax', 'sinner', 'souter', 'readout',
+    'gain', 'scale', 'psfgfac', 'psfwidth', 'psfpostweak'
+)
+
+# default file names; these carry no state so they can be shared across calls
+_APER_FNAME = cline.Fname('aper.ape', hcam.APER)
+_RED_FNAME = cline.Fname('reduce.red', hcam.RED, cline.Fname.NEW)
+_BIAS_FNAME = cline.Fname('bias', hcam.HCAM)
+_FLAT_FNAME = cline.Fname('flat', hcam.HCAM)
+_DARK_FNAME = cline.Fname('dark', hcam.HCAM)
+
+# Per-instrument warning levels, maximum number of CPUs worth using (one
+# per CCD) and standard colours for the CCDs.
+_INSTRUMENTS = {
+    'hipercam' : (
+        """# Warning levels for instrument = HiPERCAM
+warn = 1 50000 64000
+warn = 2 50000 64000
+warn = 3 50000 64000
+warn = 4 50000 64000
+warn = 5 50000 64000
+""",
+        5,
+        {
+            '1' : 'purple',
+            '2' : 'green',
+            '3' : 'orange',
+            '4' : 'red',
+            '5' : 'darkred'
+        }
+    ),
+
+    'ultracam' : (
+        """# Warning levels for instrument = ULTRACAM
+warn = 1 28000 64000
+warn = 2 28000 64000
+warn = 3 50000 64000
+""",
+        3,
+        {
+            '1' : 'red',
+            '2' : 'green',
+            '3' : 'blue',
+        }
+    ),
+
+    'ultraspec' : (
+        """# Warning levels for instrument = ULTRASPEC
+warn = 1 60000 64000
+""",
+        1,
+        {
+            '1' : 'green',
+        }
+    ),
+}
+
+# used for any other instrument; all CCDs are plotted in black
+_NO_INSTRUMENT = (
+    """# No warning levels have been set!!""", 20, defaultdict(lambda: 'black')
+)
+
+# formats of the per-CCD lines of the reduce file. The light curve plot
+# lines take the CCD label and colour; the position, transmission and seeing
+# plot lines take a comment prefix, the CCD label, the target and the colour
+_EXTRACTION_FMT = (
+    '{:s} = {:s} normal'
+    ' {:.2f} {:.1f} {:.1f}'
+    ' 2.5 {:.1f} {:.1f}'
+    ' 3.0 {:.1f} {:.1f}\n'
+)
+_LIGHT_FMT_12 = (
+    'plot = {:s} 1 2 0 1 {:10s} !  '
+    ' # ccd, targ, comp, off, fac, dcol, ecol\n'
+)
+_LIGHT_FMT_1 = (
+    'plot = {:s} 1 ! 0 1 {:10s} !  '
+    ' # ccd, targ, comp, off, fac, dcol, ecol\n'
+)
+_LIGHT_FMT_32 = (
+    'plot = {:s} 3 2 0 1 {:10s} !  '
+    ' # ccd, targ, domp, off, fac, dcol, ecol\n'
+)
+_TARG_PLOT_FMT = (
+    '{:s}plot = {:s} {:s} {:10s} !  '
+    ' # ccd, targ, dcol, ecol\n'
+)
+
+# status flags to monitor for every target
+_MONITOR_FLAGS = (
+    'NO_EXTRACTION TARGET_SATURATED TARGET_AT_EDGE'
+    ' TARGET_NONLINEAR NO_SKY NO_FWHM NO_DATA SKY_AT_EDGE'
+)
+_MONITOR_SUFFIX = ' = ' + _MONITOR_FLAGS + '\n'
+
+# format of the time stamp recorded in the reduce file
+_TSTAMP_FMT = "%d %b %Y %H:%M:%S (UTC)"
+
 ################################################
 #
 # genred -- generates a reduce file
@@ -118,8 +225,9 @@ def genred(args=None):
 
         fft : bool [hidden]
            whether or not to use FFTs when carrying out the convolution
-           operation used in the initial search. No effect on results,
-           but could be faster for large values of smoothfwhm.
+           operation used in the initial search. No effect on results.
+           The default direct method uses separable 1D passes and is
+           normally the faster of the two on search boxes.
 
         method   : string
            profile fitting method. 'g' for gaussian, 'm' for moffat
@@ -132,7 +240,9 @@ def genred(args=None):
            it wandering to silly values which can happen.
 
         fwhm     : float [hidden]
-           the default FWHM to use when fitting [unbinned pixels].
+           the default FWHM to use when fitting [unbinned pixels]. This also
+           sets the default sub-pixellation factor 'fit_ndiv' written to the
+           reduce file: 3 if fwhm < 2.5, 2 if fwhm < 3.5, 0 otherwise.
 
         fwhmmin  : float [hidden]
            the default FWHM to use when fitting [unbinned pixels].
@@ -236,52 +346,19 @@ def genred(args=None):
     with Cline('HIPERCAM_ENV', '.hipercam', command, args) as cl:
 
         # register parameters
-        cl.register('apfile', Cline.LOCAL, Cline.PROMPT)
-        cl.register('rfile', Cline.GLOBAL, Cline.PROMPT)
-        cl.register('comment', Cline.LOCAL, Cline.PROMPT)
-        cl.register('bias', Cline.LOCAL, Cline.PROMPT)
-        cl.register('flat', Cline.LOCAL, Cline.PROMPT)
-        cl.register('dark', Cline.LOCAL, Cline.PROMPT)
-        cl.register('linear', Cline.LOCAL, Cline.PROMPT)
-        cl.register('inst', Cline.LOCAL, Cline.HIDE)
-        cl.register('ncpu', Cline.LOCAL, Cline.HIDE)
-        cl.register('ngroup', Cline.LOCAL, Cline.HIDE)
-        cl.register('extendx', Cline.LOCAL, Cline.HIDE)
-        cl.register('ccd', Cline.LOCAL, Cline.HIDE)
-        cl.register('location', Cline.LOCAL, Cline.HIDE)
-        cl.register('toffset', Cline.LOCAL, Cline.HIDE)
-        cl.register('smoothfwhm', Cline.LOCAL, Cline.HIDE)
-        cl.register('fft', Cline.LOCAL, Cline.HIDE)
-        cl.register('beta', Cline.LOCAL, Cline.HIDE)
-        cl.register('betamax', Cline.LOCAL, Cline.HIDE)
-        cl.register('fwhm', Cline.LOCAL, Cline.HIDE)
-        cl.register('method', Cline.LOCAL, Cline.HIDE)
-        cl.register('fwhmmin', Cline.LOCAL, Cline.HIDE)
-        cl.register('searchwidth', Cline.LOCAL, Cline.HIDE)
-        cl.register('fitwidth', Cline.LOCAL, Cline.HIDE)
-        cl.register('maxshift', Cline.LOCAL, Cline.HIDE)
-        cl.register('thresh', Cline.LOCAL, Cline.HIDE)
-        cl.register('hminref', Cline.LOCAL, Cline.HIDE)
-        cl.register('hminnrf', Cline.LOCAL, Cline.HIDE)
-        cl.register('alpha', Cline.LOCAL, Cline.HIDE)
-        cl.register('diff', Cline.LOCAL, Cline.HIDE)
-        cl.register('rfac', Cline.LOCAL, Cline.HIDE)
-        cl.register('rmin', Cline.LOCAL, Cline.HIDE)
-        cl.register('rmax', Cline.LOCAL, Cline.HIDE)
-        cl.register('sinner', Cline.LOCAL, Cline.HIDE)
-        cl.register('souter', Cline.LOCAL, Cline.HIDE)
-        cl.register('readout', Cline.LOCAL, Cline.HIDE)
-        cl.register('gain', Cline.LOCAL, Cline.HIDE)
-        cl.register('scale', Cline.LOCAL, Cline.HIDE)
-        cl.register('psfgfac', Cline.LOCAL, Cline.HIDE)
-        cl.register('psfwidth', Cline.LOCAL, Cline.HIDE)
-        cl.register('psfpostweak', Cline.LOCAL, Cline.HIDE)
+        for param in _PROMPTED:
+            cl.register(
+                param, Cline.GLOBAL if param == 'rfile' else Cline.LOCAL,
+                Cline.PROMPT
+            )
+        for param in _HIDDEN:
+            cl.register(param, Cline.LOCAL, Cline.HIDE)
 
         # get inputs
 
         # the aperture file
         apfile = cl.get_value(
-            'apfile', 'aperture input file', cline.Fname('aper.ape',hcam.APER)
+            'apfile', 'aperture input file', _APER_FNAME
         )
         # Read the aperture file
         aper = hcam.MccdAper.read(apfile)
@@ -289,7 +366,7 @@ def genred(args=None):
         # the reduce file
         rfile = cl.get_value(
             'rfile', 'reduce output file',
-            cline.Fname('reduce.red',hcam.RED,cline.Fname.NEW)
+            _RED_FNAME
         )
 
         # user comment string
@@ -308,21 +385,21 @@ def genred(args=None):
         # bias frame
         bias = cl.get_value(
             'bias', "bias frame ['none' to ignore]",
-            cline.Fname('bias', hcam.HCAM), ignore='none'
+            _BIAS_FNAME, ignore='none'
         )
         bias = '' if bias is None else bias
 
         # flat field frame
         flat = cl.get_value(
             'flat', "flat field frame ['none' to ignore]",
-            cline.Fname('flat', hcam.HCAM), ignore='none'
+            _FLAT_FNAME, ignore='none'
         )
         flat = '' if flat is None else flat
 
         # dark frame
         dark = cl.get_value(
             'dark', "dark field frame ['none' to ignore]",
-            cline.Fname('dark', hcam.HCAM), ignore='none'
+            _DARK_FNAME, ignore='none'
         )
         dark = '' if dark is None else dark
 
@@ -331,33 +408,7 @@ def genred(args=None):
             'hipercam', lvals=['hipercam', 'ultracam', 'ultraspec','ignore']
         )
 
-        if inst == 'hipercam':
-            warn_levels = """# Warning levels for instrument = HiPERCAM
-warn = 1 50000 64000
-warn = 2 50000 64000
-warn = 3 50000 64000
-warn = 4 50000 64000
-warn = 5 50000 64000
-"""
-            maxcpu = 5
-
-        elif inst == 'ultracam':
-            warn_levels = """# Warning levels for instrument = ULTRACAM
-warn = 1 28000 64000
-warn = 2 28000 64000
-warn = 3 50000 64000
-"""
-            maxcpu = 3
-
-        elif inst == 'ultraspec':
-            warn_levels = """# Warning levels for instrument = ULTRASPEC
-warn = 1 60000 64000
-"""
-            maxcpu = 1
-
-        else:
-            warn_levels = """# No warning levels have been set!!"""
-            maxcpu = 20
+        warn_levels, maxcpu, CCD_COLS = _INSTRUMENTS.get(inst, _NO_INSTRUMENT)
 
         if maxcpu > 1:
             ncpu = cl.get_value(
@@ -400,8 +451,8 @@ warn = 1 60000 64000
             'v', lvals=['f','v']
         )
         location = 'variable' if location == 'v' else 'fixed'
-        comm_seeing = '#' if location == 'fixed' else ''
-        comm_position = '#' if location == 'fixed' else ''
+        # the position and seeing plots are commented out for fixed apertures
+        comment_prefix = '#' if location == 'fixed' else ''
 
         cl.set_default('toffset',0)
         toffset = cl.get_value(
@@ -527,193 +578,104 @@ warn = 1 60000 64000
     #
     # all the inputs have now been obtained. Get on with doing stuff
 
-    # Generate the extraction lines. Note that the aperture location
-    # parameter maps into the same names as the aperture re-size
-    # parameter
-    extraction = ''
-    for cnam in aper:
-        extraction += (
-            '{:s} = {:s} normal'
-            ' {:.2f} {:.1f} {:.1f}'
-            ' 2.5 {:.1f} {:.1f}'
-            ' 3.0 {:.1f} {:.1f}\n').format(
+    # Generate the extraction and the light curve, transmission and
+    # seeing plot lines in a single pass over the CCDs. Note that the
+    # aperture location parameter maps into the same names as the
+    # aperture re-size parameter
+    extraction, light_plot, transmission_plot, seeing_plot = [], [], [], []
+    no_light = no_transmission = no_seeing = True
+    for cnam, ccdaper in aper.items():
+        has1, has2, has3 = '1' in ccdaper, '2' in ccdaper, '3' in ccdaper
+
+        extraction.append(
+            _EXTRACTION_FMT.format(
                 cnam, location, rfac, rmin, rmax,
                 sinner, sinner, souter, souter
             )
+        )
 
-    # standard colours for CCDs
-    if inst == 'hipercam':
-        CCD_COLS = {
-            '1' : 'purple',
-            '2' : 'green',
-            '3' : 'orange',
-            '4' : 'red',
-            '5' : 'darkred'
-        }
-
-    elif inst == 'ultracam':
-        CCD_COLS = {
-            '1' : 'red',
-            '2' : 'green',
-            '3' : 'blue',
-        }
-
-    elif inst == 'ultraspec':
-        CCD_COLS = {
-            '1' : 'green',
-        }
-
-    # Generate the light curve plot lines
-    light_plot = ''
-    no_light = True
-    for cnam in aper:
-        ccdaper = aper[cnam]
-        if '1' in ccdaper and '2' in ccdaper:
-            light_plot += (
-                'plot = {:s} 1 2 0 1 {:10s} !  '
-                ' # ccd, targ, comp, off, fac, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
+        # light curve
+        if has1 and has2:
+            light_plot.append(_LIGHT_FMT_12.format(cnam, CCD_COLS[cnam]))
             no_light = False
 
-        elif '1' in ccdaper and '2' not in ccdaper:
-            light_plot += (
-                'plot = {:s} 1 ! 0 1 {:10s} !  '
-                ' # ccd, targ, comp, off, fac, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
+        elif has1:
+            light_plot.append(_LIGHT_FMT_1.format(cnam, CCD_COLS[cnam]))
             no_light = False
 
-        if '2' in ccdaper and '3' in ccdaper:
-            light_plot += (
-                'plot = {:s} 3 2 0 1 {:10s} !  '
-                ' # ccd, targ, domp, off, fac, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
+        if has2 and has3:
+            light_plot.append(_LIGHT_FMT_32.format(cnam, CCD_COLS[cnam]))
             no_light = False
 
-    if no_light:
-        raise hcam.HipercamError(
-            'Found no targets for light curve plots in any CCD; cannot make light curve plot'
-        )
-
-    # Generate the position plot lines
-    position_plot = ''
-    ccdaper = aper[ccd]
-    no_position = True
-    if '2' in ccdaper:
-        position_plot += (
-            '{:s}plot = {:s} 2 {:10s} !  '
-            ' # ccd, targ, dcol, ecol\n').format(
-                comm_position, ccd, CCD_COLS[ccd]
+        # transmission
+        if has2 or has3 or has1:
+            transmission_plot.append(
+                _TARG_PLOT_FMT.format(
+                    '', cnam, '2' if has2 else '3' if has3 else '1',
+                    CCD_COLS[cnam]
+                )
             )
-        no_position = False
+            no_transmission = False
 
-    elif '3' in ccdaper:
-        position_plot += (
-            '{:s}plot = {:s} 3 {:10s} !  '
-            ' # ccd, targ, dcol, ecol\n').format(
-                comm_position, ccd, CCD_COLS[ccd]
-            )
-        no_position = False
+        # seeing, from the first of targets 1, 2 and 3 that is not linked
+        for targ in ('1', '2', '3'):
+            ap = ccdaper.get(targ)
+            if ap is not None and not ap.linked:
+                seeing_plot.append(
+                    _TARG_PLOT_FMT.format(
+                        comment_prefix, cnam, targ, CCD_COLS[cnam]
+                    )
+                )
+                no_seeing = False
+                break
 
-    elif '1' in ccdaper:
-        position_plot += (
-            '{:s}plot = {:s} 1 {:10s} !  '
-            ' # ccd, targ, dcol, ecol\n').format(
-                comm_position, ccd, CCD_COLS[ccd]
-            )
-        no_position = False
+    extraction = ''.join(extraction)
+    light_plot = ''.join(light_plot)
+    transmission_plot = ''.join(transmission_plot)
+    seeing_plot = ''.join(seeing_plot)
 
-    if no_position:
+    if no_light:
         raise hcam.HipercamError(
-            'Targets 1, 2 and 3 not found in '
-            'CCD = {:s}; cannot make position plot'.format(ccd)
+            'Found no targets for light curve plots in any CCD; cannot make light curve plot'
         )
 
-    # Generate the transmission plot lines
-    transmission_plot = ''
-    no_transmission = True
-    for cnam in aper:
-        ccdaper = aper[cnam]
-        if '2' in ccdaper:
-            transmission_plot += (
-                'plot = {:s} 2 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
-            no_transmission = False
-
-        elif '3' in ccdaper:
-            transmission_plot += (
-                'plot = {:s} 3 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
-            no_transmission = False
-
-        elif '1' in ccdaper:
-            transmission_plot += (
-                'plot = {:s} 1 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    cnam, CCD_COLS[cnam]
-                )
-            no_transmission = False
-
     if no_transmission:
         raise hcam.HipercamError(
             'Targets 1, 2 and 3 not found in any CCDs;'
             ' cannot make transmission plot'
         )
 
-    # Generate the seeing plot lines
-    seeing_plot = ''
-    no_seeing = True
-    for cnam in aper:
-        ccdaper = aper[cnam]
-        if '1' in ccdaper and not ccdaper['1'].linked:
-            seeing_plot += (
-                '{:s}plot = {:s} 1 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    comm_seeing, cnam, CCD_COLS[cnam]
-                )
-            no_seeing = False
-
-        elif '2' in ccdaper and not ccdaper['2'].linked:
-            seeing_plot += (
-                '{:s}plot = {:s} 2 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    comm_seeing, cnam, CCD_COLS[cnam]
-                )
-            no_seeing = False
-
-        elif '3' in ccdaper  and not ccdaper['3'].linked:
-            seeing_plot += (
-                '{:s}plot = {:s} 3 {:10s} !  '
-                ' # ccd, targ, dcol, ecol\n').format(
-                    comm_seeing, cnam, CCD_COLS[cnam]
-                )
-            no_seeing = False
-
     if no_seeing:
         raise hcam.HipercamError(
             'Targets 1, 2 and 3 not found in any CCD'
             ' (or they are linked); cannot make seeing plot'
         )
 
+    # Generate the position plot line from the first of targets 2, 3
+    # and 1 present in the chosen CCD
+    ccdaper = aper[ccd]
+    for targ in ('2', '3', '1'):
+        if targ in ccdaper:
+            position_plot = _TARG_PLOT_FMT.format(
+                comment_prefix, ccd, targ, CCD_COLS[ccd]
+            )
+            break
+    else:
+        raise hcam.HipercamError(
+            'Targets 1, 2 and 3 not found in '
+            'CCD = {:s}; cannot make position plot'.format(ccd)
+        )
+
     # monitor targets (whole lot by default)
-    targs = set()
-    for cnam in aper:
-        ccdaper = aper[cnam]
-        for targ in ccdaper:
-            targs.add(targ)
-    monitor = ''
-    for targ in sorted(targs):
-        monitor += ('{:s} = NO_EXTRACTION TARGET_SATURATED TARGET_AT_EDGE'
-                    ' TARGET_NONLINEAR NO_SKY NO_FWHM NO_DATA SKY_AT_EDGE\n').format(targ)
+    targs = set().union(*aper.values())
+    monitor = ''.join(targ + _MONITOR_SUFFIX for targ in sorted(targs))
+
+    # sub-pixellation factor for the profile fits: only worth its cost
+    # (ndiv**2 evaluations per pixel) if the images are under-sampled
+    fit_ndiv = 3 if fwhm < 2.5 else 2 if fwhm < 3.5 else 0
 
     # time stamp
-    tstamp = strftime("%d %b %Y %H:%M:%S (UTC)", gmtime())
+    tstamp = strftime(_TSTAMP_FMT, gmtime())
 
     # finally write out the reduce file.
     with open(rfile, 'w') as fout:
@@ -721,15 +683,16 @@ warn = 1 60000 64000
         fout.write(
             TEMPLATE.format(
                 version=hcam.REDUCE_FILE_VERSION, apfile=apfile,
-                fwhm=fwhm, fwhm_min=fwhm_min, extraction=extraction,
+                fwhm=fwhm, fwhm_min=fwhm_min, fit_ndiv=fit_ndiv,
+                extraction=extraction,
                 bias=bias, flat=flat, dark=dark,
                 smooth_fwhm=smooth_fwhm, linear=linear,
                 light_plot=light_plot, position_plot=position_plot,
                 transmission_plot=transmission_plot, seeing_plot=seeing_plot,
                 monitor=monitor, comment=comment, tstamp=tstamp,
                 hipercam_version=hipercam_version, location=location,
-                comm_seeing=comm_seeing, extendx=extendx,
-                comm_position=comm_position, scale=scale,
+                comm_seeing=comment_prefix, extendx=extendx,
+                comm_position=comment_prefix, scale=scale,
                 warn_levels=warn_levels, ncpu=ncpu, ngroup=ngroup,
                 search_half_width=search_half_width,
                 fit_half_width=fit_half_width, profile_type=profile_type,
@@ -809,10 +772,16 @@ toffset = {toffset:d} # offset subtracted from the MJD
 # also an advantage in terms of reducing parallelisation overheads in
 # reading frames a few at a time before processing. This is controlled
 # using 'ngroup'. i.e. with ngroup=10, 10 full frames are read before
-# being processed. This parameter is ignored if ncpu==1
+# being processed. This parameter is ignored if ncpu==1. 'parallel'
+# sets whether the CCDs are processed in separate 'processes' or in
+# 'threads' of the one process. Threads avoid the cost of starting
+# processes and of copying the frames over to them, which can pay off
+# for small frames or where new processes are slow to start (macOS,
+# Windows), but processes usually win when the fits dominate.
 
 ncpu = {ncpu}
 ngroup = {ngroup}
+parallel = processes # 'processes' or 'threads'
 
 # The next section '[apertures]' defines how the apertures are
 # re-positioned from frame to frame. Apertures are re-positioned
@@ -842,10 +811,10 @@ ngroup = {ngroup}
 # result, but you should then probably choose a threshold of 7 when
 # you might have thought 50 was appropriate. The smoothing itself can
 # be carried out by direct convolution or by an FFT-based method. The
-# end-result is the same either way but for large values of
-# 'search_smooth_fwhm', i.e. >> 1, FFTs may offer an advantage
-# speed-wise. But the only way to tell is by explicity running with
-# 'search_smooth_fft' switched from 'no' to 'yes'.
+# end-result is the same either way. The direct method smooths with two
+# 1D passes, taking advantage of the separability of the gaussian, and
+# is normally much faster on search-box sized regions even for large
+# 'search_smooth_fwhm', so 'search_smooth_fft' is best left at 'no'.
 
 # The boxes for the fits ('fit_half_width') need to be large enough to
 # include the target and a bit of sky to ensure that the FWHM is
@@ -867,9 +836,11 @@ ngroup = {ngroup}
 # if the pixels are binned; second, it will evaluate the profile over
 # an ndiv by ndiv square grid within each unbinned pixel. Obviously
 # this will slow things, but it could help if your images are
-# under-sampled. I would always start with fit_ndiv=0, and only raise
-# it if the measured FWHM seem to be close to or below two binned
-# pixels.
+# under-sampled. genred sets it from the starting FWHM (3 if fit_fwhm
+# < 2.5, 2 if < 3.5, else 0); otherwise I would always start with
+# fit_ndiv=0, and only raise it if the measured FWHM seem to be close
+# to or below two binned pixels. reduce warns if that happens with
+# fit_ndiv=0.
 
 # If you use reference targets (you should if possible), the initial
 # positions for the non-reference targets should be good. You can then
@@ -915,7 +886,7 @@ fit_beta = {beta:.1f} # Moffat exponent
 fit_beta_max = {beta_max:.1f} # max Moffat expt for later fits
 fit_fwhm = {fwhm:.1f} # FWHM, unbinned pixels
 fit_fwhm_min = {fwhm_min:.1f} # Minimum FWHM, unbinned pixels
-fit_ndiv = 0 # sub-pixellation factor
+fit_ndiv = {fit_ndiv:d} # sub-pixellation factor
 fit_fwhm_fixed = no # Might want to set = 'yes' for defocussed images
 fit_half_width = {fit_half_width:d} # for fit, unbinned pixels
 fit_thresh = {thresh:.2f} # RMS rejection threshold for fits
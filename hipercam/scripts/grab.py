@@ -5,6 +5,8 @@ import os
 import time
 import tempfile
 import getpass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -14,6 +16,9 @@ from hipercam.cline import Cline
 
 __all__ =  ['grab',]
 
+# maximum number of frames waiting to be written to disk
+MAXPEND = 4
+
 ###########################################################
 #
 # grab -- downloads a series of images from a raw data file
@@ -181,6 +186,12 @@ def grab(args=None):
     root = os.path.basename(resource)
     bframe = None
 
+    # Only servers, or local files read from the end (first=0) while they are
+    # still being written, can return None for a frame not yet available.
+    # Other local sources simply stop at the end of the file, so they skip
+    # the waiting.
+    may_wait = source.endswith('s') or first == 0
+
     # Finally, we can go
     if temp:
         # create a directory on temp for the temporary file to avoid polluting
@@ -188,23 +199,37 @@ def grab(args=None):
         fnames = []
         tdir = os.path.join(tempfile.gettempdir(), 'hipercam-{:s}'.format(getpass.getuser()))
         os.makedirs(tdir,exist_ok=True)
-
-    with spooler.data_source(source, resource, first) as spool:
+    else:
+        # start of the output file names, to which only the frame number
+        # and extension need adding. root is kept out of the format string
+        # in case it contains braces.
+        fname_root = root + '_'
+
+    # Frames are written to disk in a separate thread so that each write
+    # overlaps with reading the next frame. 'pending' holds (frame number,
+    # file name, future) for writes not yet reported, oldest first; it is
+    # kept short to limit the memory tied up in frames awaiting writing.
+    pending = deque()
+    verify = 'exception'
+
+    with spooler.data_source(source, resource, first) as spool, \
+         ThreadPoolExecutor(max_workers=1) as writer:
 
         try:
 
             for mccd in spool:
 
-                # Handle the waiting game ...
-                give_up, try_again, total_time = spooler.hang_about(
-                    mccd, twait, tmax, total_time
-                    )
+                if may_wait:
+                    # Handle the waiting game ...
+                    give_up, try_again, total_time = spooler.hang_about(
+                        mccd, twait, tmax, total_time
+                        )
 
-                if give_up:
-                    print('grab stopped')
-                    break
-                elif try_again:
-                    continue
+                    if give_up:
+                        print('grab stopped')
+                        break
+                    elif try_again:
+                        continue
 
                 # Trim the frames: ULTRACAM windowed data has bad
                 # columns and rows on the sides of windows closest to
@@ -237,23 +262,40 @@ def grab(args=None):
                 if temp:
                     # generate name automatically
                     fd, fname = tempfile.mkstemp(suffix=hcam.HCAM, dir=tdir)
-                    mccd.write(fname,True)
                     os.close(fd)
                     fnames.append(fname)
                 else:
-                    fname = '{:s}_{:0{:d}}{:s}'.format(root,nframe,ndigit,hcam.HCAM)
-                    mccd.write(fname,True)
+                    fname = fname_root + '{:0{:d}}{:s}'.format(
+                        nframe,ndigit,hcam.HCAM
+                    )
+
+                pending.append(
+                    (nframe, fname, writer.submit(
+                        mccd.write, fname, True, output_verify=verify
+                    ))
+                )
 
-                print('Written frame {:d} to {:s}'.format(nframe,fname))
+                # the headers only differ in their values from frame to
+                # frame, so only the first frame written is verified
+                verify = 'ignore'
 
+                if len(pending) > MAXPEND:
+                    _written(pending)
 
                 # update the frame number
                 nframe += 1
                 if last and nframe > last:
                     break
 
+            while pending:
+                _written(pending)
+
         except KeyboardInterrupt:
-            # trap ctrl-C so we can delete temporary files if temp
+            # trap ctrl-C so we can delete temporary files if temp, first
+            # making sure that no more writes are under way
+            for nf, fname, future in pending:
+                future.cancel()
+            writer.shutdown()
             if temp:
                 for fname in fnames:
                     os.remove(fname)
@@ -279,3 +321,10 @@ def grab(args=None):
 
         # return the name of the file list
         return fname
+
+def _written(pending):
+    """Waits for the oldest write in `pending` to finish, removes it and
+    reports it. Any exception raised by the write is passed on."""
+    nframe, fname, future = pending.popleft()
+    future.result()
+    print('Written frame {:d} to {:s}'.format(nframe,fname))
@@ -10,6 +10,7 @@ import numpy as np
 import hipercam as hcam
 from hipercam import cline, utils
 from hipercam.cline import Cline
+from hipercam.scripts import grab, combine
 
 __all__ =  ['makedark',]
 
@@ -148,7 +149,7 @@ def makedark(args=None):
             str(first),str(last),str(twait),
             str(tmax),'none','f32'
         ]
-    flist = hcam.scripts.grab(args)
+    flist = grab(args)
 
     if first == 1:
         # test readout mode if the first == 1 as, with non clear modes, the
@@ -183,7 +184,7 @@ has been determined with respect to clears."""
             None, 'prompt', flist, 'none', 'none', 'none', 'c', str(sigma),
             'i', 'yes', output
         ]
-        hcam.scripts.combine(args)
+        combine(args)
 
         # remove temporary files
         with open(flist) as fin:
@@ -8,6 +8,7 @@ import numpy as np
 import hipercam as hcam
 from hipercam import cline, utils, spooler
 from hipercam.cline import Cline
+from hipercam.scripts import grab
 
 __all__ = ['makeflat',]
 
@@ -258,7 +259,7 @@ def makeflat(args=None):
                     str(first),str(last),str(twait),
                     str(tmax),'none','f32'
                 ]
-            resource = hcam.scripts.grab(args)
+            resource = grab(args)
 
         # at this point 'resource' is a list of files, no matter the input
         # method.
@@ -1,5 +1,6 @@
 import sys
 import multiprocessing
+import multiprocessing.pool
 import warnings
 import numpy as np
 
@@ -22,10 +23,10 @@ from hipercam.reduction import (
 )
 
 # get hipercam version to write into the reduce log file
-from pkg_resources import get_distribution, DistributionNotFound
+from importlib.metadata import version, PackageNotFoundError
 try:
-    hipercam_version = get_distribution('hipercam').version
-except DistributionNotFound:
+    hipercam_version = version('hipercam')
+except PackageNotFoundError:
     hipercam_version = 'not found'
 
 __all__ = ['psf_reduce', ]
@@ -365,7 +366,10 @@ def psf_reduce(args=None):
 
         ncpu = rfile['general']['ncpu']
         if ncpu > 1:
-            pool = multiprocessing.Pool(processes=ncpu)
+            if rfile['general']['parallel'] == 'threads':
+                pool = multiprocessing.pool.ThreadPool(processes=ncpu)
+            else:
+                pool = multiprocessing.Pool(processes=ncpu)
         else:
             pool = None
 
@@ -770,12 +774,12 @@ def extractFlux(cnam, ccd, rccd, read, gain, ccdwin, rfile, store):
             else:
                 result_row = result_row[0]
 
-            # compute X, Y arrays over the sub-window relative to the centre
-            # of the aperture and the distance squared from the centre (Rsq)
-            # to save a little effort.
+            # compute the distance squared from the centre of the aperture
+            # (Rsq) over the sub-window. The X, Y grids are kept 'sparse',
+            # i.e. as a row and a column, so that only Rsq is built in 2D.
             x = swdata.x(np.arange(swdata.nx))-aper.x
             y = swdata.y(np.arange(swdata.ny))-aper.y
-            X, Y = np.meshgrid(x, y)
+            X, Y = np.meshgrid(x, y, sparse=True)
             Rsq = X**2 + Y**2
 
             # size of a pixel which is used to taper pixels as they approach
@@ -38,6 +38,10 @@ from astropy.stats import gaussian_fwhm_to_sigma, SigmaClip
 import hipercam as hcam
 from hipercam import cline, utils
 from hipercam.cline import Cline
+# going through the package first binds hipercam.scripts.psf_reduce to
+# the command; importing the submodule directly would leave it bound to
+# the module
+from hipercam.scripts import psf_reduce
 from hipercam.scripts.psf_reduce import MoffatPSF
 
 __all__ = ['psfaper', ]
@@ -1,5 +1,6 @@
 import sys
 import multiprocessing
+import multiprocessing.pool
 import numpy as np
 import warnings
 
@@ -13,10 +14,10 @@ from hipercam.reduction import (
 )
 
 # get hipercam version to write into the reduce log file
-from pkg_resources import get_distribution, DistributionNotFound
+from importlib.metadata import version, PackageNotFoundError
 try:
-    hipercam_version = get_distribution('hipercam').version
-except DistributionNotFound:
+    hipercam_version = version('hipercam')
+except PackageNotFoundError:
     hipercam_version = 'not found'
 
 __all__ = ['reduce', ]
@@ -389,7 +390,10 @@ def reduce(args=None):
 
         ncpu = rfile['general']['ncpu']
         if ncpu > 1:
-            pool = multiprocessing.Pool(processes=ncpu)
+            if rfile['general']['parallel'] == 'threads':
+                pool = multiprocessing.pool.ThreadPool(processes=ncpu)
+            else:
+                pool = multiprocessing.Pool(processes=ncpu)
         else:
             pool = None
 
@@ -846,22 +850,32 @@ def extractFlux(cnam, ccd, rccd, read, gain, ccdwin, rfile, store):
 
             # compute X, Y arrays over the sub-window relative to the centre
             # of the aperture and the distance squared from the centre (Rsq)
-            # to save a little effort.
+            # to save a little effort. The X, Y grids are kept 'sparse', i.e.
+            # as a row and a column, since the circle tests are separable in x
+            # and y: broadcasting then only ever builds the final 2D arrays.
             x = swdata.x(np.arange(swdata.nx))-aper.x
             y = swdata.y(np.arange(swdata.ny))-aper.y
-            X, Y = np.meshgrid(x, y)
+            X, Y = np.meshgrid(x, y, sparse=True)
             Rsq = X**2 + Y**2
 
             # squared aperture radii for comparison
             R1sq, R2sq, R3sq = aper.rtarg**2, aper.rsky1**2, aper.rsky2**2
 
             # sky selection, accounting for masks and extra (which we assume
-            # acts like a sky mask as well)
+            # acts like a sky mask as well). Masks can only affect pixels
+            # within their bounding box, so only that part of the sub-window
+            # is tested (x and y increase monotonically).
             sok = (Rsq > R2sq) & (Rsq < R3sq)
-            for xoff, yoff, radius in aper.mask:
-                sok &= (X-xoff)**2 + (Y-yoff)**2 > radius**2
-            for xoff, yoff in aper.extra:
-                sok &= (X-xoff)**2 + (Y-yoff)**2 > R1sq
+            masks = aper.mask + [
+                (xoff, yoff, aper.rtarg) for xoff, yoff in aper.extra
+            ]
+            for xoff, yoff, radius in masks:
+                ix1 = x.searchsorted(xoff-radius)
+                ix2 = x.searchsorted(xoff+radius, side='right')
+                iy1 = y.searchsorted(yoff-radius)
+                iy2 = y.searchsorted(yoff+radius, side='right')
+                sok[iy1:iy2,ix1:ix2] &= \
+                    (X[:,ix1:ix2]-xoff)**2 + (Y[iy1:iy2]-yoff)**2 > radius**2
 
             # sky data
             dsky = swdata.data[sok]
@@ -991,16 +1005,20 @@ def extractFlux(cnam, ccd, rccd, read, gain, ccdwin, rfile, store):
                         ' with optimal extraction'
                     )
 
+                    # X, Y positions of the selected pixels (in the same
+                    # order as data[dok])
+                    iy, ix = np.nonzero(dok)
+
                     mbeta = store['mbeta']
                     if mbeta > 0.:
                         prof = fitting.moffat(
-                            X[dok], Y[dok], 0., 1., 0., 0., mfwhm, mbeta,
+                            x[ix], y[iy], 0., 1., 0., 0., mfwhm, mbeta,
                             wdata.xbin, wdata.ybin,
                             rfile['apertures']['fit_ndiv']
                         )
                     else:
                         prof = fitting.gaussian(
-                            X[dok], Y[dok], 0., 1., 0., 0., mfwhm,
+                            x[ix], y[iy], 0., 1., 0., 0., mfwhm,
                             wdata.xbin, wdata.ybin,
                             rfile['apertures']['fit_ndiv']
                         )
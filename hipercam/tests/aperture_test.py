@@ -0,0 +1,57 @@
+import unittest
+import os
+import json
+import tempfile
+
+from hipercam import Aperture
+from hipercam.aperture import _Decoder
+
+class TestAperture(unittest.TestCase):
+    """
+    Provides unit tests of the JSON serialisation of the Aperture class
+    """
+
+    def setUp(self):
+        self.aper = Aperture(
+            51.5, 65.25, 6., 10., 15., True,
+            mask=[(3.,-4.,2.5)], extra=[(1.5,2.)]
+        )
+
+    def check_aper(self, aper):
+        self.assertEqual(aper.x, self.aper.x, 'x incorrectly restored')
+        self.assertEqual(aper.y, self.aper.y, 'y incorrectly restored')
+        self.assertEqual(aper.rtarg, self.aper.rtarg,
+                         'rtarg incorrectly restored')
+        self.assertEqual(aper.rsky1, self.aper.rsky1,
+                         'rsky1 incorrectly restored')
+        self.assertEqual(aper.rsky2, self.aper.rsky2,
+                         'rsky2 incorrectly restored')
+        self.assertEqual(aper.ref, self.aper.ref, 'ref incorrectly restored')
+        self.assertEqual(aper.link, self.aper.link, 'link incorrectly restored')
+
+        # JSON turns tuples into lists
+        self.assertEqual(
+            [tuple(m) for m in aper.mask], self.aper.mask,
+            'mask incorrectly restored'
+        )
+        self.assertEqual(
+            [tuple(e) for e in aper.extra], self.aper.extra,
+            'extra incorrectly restored'
+        )
+
+    def test_aperture_write_read(self):
+        fd, fname = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            self.aper.write(fname)
+            aper = Aperture.read(fname)
+        finally:
+            os.remove(fname)
+        self.check_aper(aper)
+
+    def test_aperture_toString(self):
+        aper = json.loads(self.aper.toString(), cls=_Decoder)
+        self.check_aper(aper)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+from hipercam.hcam import _demultiplex, BZERO
+
+def demultiplex_reference(raw, nsamps, flips, ny, nx):
+    """The strided / flip de-multiplexing that _demultiplex replaced"""
+    allwins = np.frombuffer(raw, '>u2').copy()
+    allwins += BZERO
+    if nsamps == 4:
+        data = allwins.reshape(ny, nx, 5, 4).transpose(2, 3, 0, 1)
+    else:
+        data = allwins.reshape(-1, 5, 4, 4).transpose(
+            1, 3, 0, 2
+        ).reshape(5, 4, ny, nx)
+
+    out = np.empty((5, 4, ny, nx), dtype=np.float32)
+    for nccd in range(5):
+        for nquad in range(4):
+            windata = data[nccd, nquad]
+            for ax in (0, 1):
+                if flips[nccd, nquad, ax]:
+                    windata = np.flip(windata, ax)
+            out[nccd, nquad] = windata.astype(np.float32)
+    return out
+
+class TestDemultiplex(unittest.TestCase):
+    """
+    Checks the de-multiplexing of raw HiPERCAM frames against the
+    reference strided / flip implementation
+    """
+
+    def setUp(self):
+        # window dimensions; nx*ny must be a multiple of 4 for NSAMP=1
+        self.ny, self.nx = 6, 8
+        rng = np.random.default_rng(1234)
+
+        # cover the full range of raw values, including those either
+        # side of the BZERO offset
+        npix = 20*self.ny*self.nx
+        pixels = rng.integers(0, 65536, npix, dtype=np.uint16)
+        pixels[:4] = (0, BZERO-1, BZERO, 65535)
+        self.raw = pixels.astype('>u2').tobytes()
+
+        # every combination of flips appears among the 20 quadrants
+        self.flips = np.zeros((5, 4, 2), dtype=np.bool_)
+        for n in range(20):
+            self.flips[n // 4, n % 4] = (n & 1, (n >> 1) & 1)
+
+    def check(self, nsamps, flips):
+        data = np.empty((5, 4, self.ny, self.nx), dtype=np.float32)
+        _demultiplex(
+            np.frombuffer(self.raw, np.uint8), nsamps, flips, data
+        )
+        ref = demultiplex_reference(
+            self.raw, nsamps, flips, self.ny, self.nx
+        )
+        self.assertTrue(np.array_equal(data, ref),
+                        'de-multiplexed data differ from reference')
+
+    def test_demultiplex_nsamp4(self):
+        self.check(4, self.flips)
+
+    def test_demultiplex_nsamp1(self):
+        self.check(1, self.flips)
+
+    def test_demultiplex_noflips(self):
+        flips = np.zeros_like(self.flips)
+        self.check(4, flips)
+        self.check(1, flips)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import importlib
+
+import hipercam.scripts
+
+class TestScripts(unittest.TestCase):
+    """
+    Checks that the lazily-imported commands of hipercam.scripts stay bound
+    to their functions rather than to the modules defining them
+    """
+
+    def test_scripts_grab_after_averun(self):
+        importlib.import_module('hipercam.scripts.averun')
+        self.assertTrue(callable(hipercam.scripts.grab),
+                        'hipercam.scripts.grab is not callable')
+        self.assertTrue(callable(hipercam.scripts.combine),
+                        'hipercam.scripts.combine is not callable')
+
+    def test_scripts_import_from_package(self):
+        from hipercam.scripts import grab, combine
+        self.assertTrue(callable(grab), 'grab is not callable')
+        self.assertTrue(callable(combine), 'combine is not callable')
+
+    def test_scripts_all_importable(self):
+        for name in hipercam.scripts.__all__:
+            self.assertTrue(callable(getattr(hipercam.scripts, name)),
+                            '{:s} is not callable'.format(name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
 import copy
+import warnings
 
 import numpy as np
-from hipercam import Winhead
+from hipercam import Winhead, Window
 
 class TestWinhead(unittest.TestCase):
     """
@@ -118,5 +119,42 @@ class TestWinhead(unittest.TestCase):
         win = self.win.copy()
         self.assertFalse(self.win != win)
 
+class TestWindowUint16(unittest.TestCase):
+    """
+    Tests of the conversion of Window data to uint16
+    """
+
+    def setUp(self):
+        self.win = Winhead(3,4,5,6,1,1)
+
+    def test_window_uint16_ok(self):
+        wind = Window(self.win, np.arange(30.).reshape((6,5)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            wind.uint16()
+        self.assertEqual(wind.data.dtype, np.uint16,
+                         'incorrect data type after conversion')
+        self.assertTrue((wind.data == np.arange(30).reshape((6,5))).all(),
+                        'incorrect values after conversion')
+
+    def test_window_uint16_range(self):
+        data = np.ones((6,5))
+        data[2,3] = 65536.
+        wind = Window(self.win, data)
+        self.assertRaises(ValueError, wind.uint16)
+
+        data[2,3] = -1.
+        wind = Window(self.win, data)
+        self.assertRaises(ValueError, wind.uint16)
+
+    def test_window_uint16_precision(self):
+        data = np.ones((6,5))
+        data[1,2] = 10.5
+        wind = Window(self.win, data)
+        with self.assertWarns(UserWarning):
+            wind.uint16()
+        self.assertEqual(wind.data.dtype, np.uint16,
+                         'incorrect data type after conversion')
+
 if __name__ == '__main__':
     unittest.main()
@@ -523,10 +523,7 @@ class Rhead(fits.Header):
         """
         Returns number of (binned) pixels per CCD
         """
-        np = 0
-        for win in self.win:
-            np += win.nx*win.ny
-        return np
+        return sum(win.nx*win.ny for win in self.win)
 
     def isPonoff(self):
         """
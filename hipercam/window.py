@@ -7,6 +7,7 @@ functions.
 import warnings
 import json
 import math
+import functools
 from collections import OrderedDict
 
 import numpy as np
@@ -43,6 +44,8 @@ class Winhead(Header):
 
     """
 
+    __slots__ = ('llx', 'lly', 'xbin', 'ybin', '_nx', '_ny')
+
     def __init__(self, llx, lly, nx, ny, xbin, ybin, head=None, copy=False):
         """
         Constructor. Arguments::
@@ -653,6 +656,8 @@ class Window(Winhead):
 
     """
 
+    __slots__ = ('data',)
+
     def __init__(self, win, data=None, copy=False):
         """Constructs a :class:`Window`
 
@@ -1083,15 +1088,17 @@ class Window(Winhead):
 
     def float32(self):
         """
-        Converts the data type of the array to float32.
+        Converts the data type of the array to float32. The array is not
+        copied if it is float32 already.
         """
-        self.data = self.data.astype(np.float32)
+        self.data = self.data.astype(np.float32, copy=False)
 
     def float64(self):
         """
-        Converts the data type of the array to float64.
+        Converts the data type of the array to float64. The array is not
+        copied if it is float64 already.
         """
-        self.data = self.data.astype(np.float64)
+        self.data = self.data.astype(np.float64, copy=False)
 
     def uint16(self):
         """
@@ -1100,16 +1107,19 @@ class Window(Winhead):
         are outside the range 0 to 65535 This is to save space on output.
         """
         if self.data.dtype != np.uint16:
-            if np.any((self.data < 0) | (self.data > 65535)):
+            if self.data.min() < 0 or self.data.max() > 65535:
                 raise ValueError('data outside range 0 to 65535')
 
-            if not np.equal(np.mod(self.data, 1), 0):
+            # any fractional parts are lost by the cast, which
+            # the comparison then picks up
+            udata = self.data.astype(np.uint16)
+            if not np.array_equal(udata, self.data):
                 warnings.warn(
                     'conversion to uint16 will result in'
                     ' loss of precision'
                 )
 
-            self.data = self.data.astype(np.uint16)
+            self.data = udata
 
     def search(self, fwhm, x0, y0, thresh, fft, max=False, percent=50.):
         """Search for a target in a :class:Window. Works by convolving the image
@@ -1143,12 +1153,12 @@ class Window(Winhead):
             filter out noise.
 
           fft : bool
-            The astropy.convolution routines are used. By default FFT-based
-            convolution is applied as it scales better with fwhm, especially
-            for fwhm >> 1, however the direct method (fft=False) may be faster
-            for small fwhm values and images and has a better behaviour at the
-            edges where it extends value with the nearest pixel while the FFT
-            wraps values.
+            If True, astropy.convolution.convolve_fft is used. Otherwise
+            scipy.ndimage.gaussian_filter is applied, which exploits the
+            separability of the gaussian to smooth with two 1D passes. The
+            direct method is much the faster for search-box sized images,
+            even for large fwhm, and pads with the image minimum at the
+            edges just as the FFT does.
 
          max : bool
             If True, just go for the highest peak, i.e. ignore x0, y0. The peak
@@ -1173,7 +1183,7 @@ class Window(Winhead):
             sigma = fwhm/np.sqrt(8*np.log(2))
             fedge = self.data.min()
             if fft:
-                kern = Gaussian2DKernel(sigma)
+                kern = _gauss_kernel(sigma)
                 cimg = convolve_fft(self.data, kern, 'fill', fedge)
             else:
                 cimg = gaussian_filter(
@@ -1417,3 +1427,11 @@ class Window(Winhead):
         data = other / self.data
         return Window(super().copy(), data)
 
+@functools.lru_cache(maxsize=8)
+def _gauss_kernel(sigma):
+    """Returns a Gaussian2DKernel of RMS sigma for FFT smoothing in
+    Window.search. Building these is relatively slow and the same sigma is
+    used on every frame of a reduction, so they are cached. convolve_fft
+    does not modify the kernel so the cached one can be shared.
+    """
+    return Gaussian2DKernel(sigma)